@@ -0,0 +1,3 @@
+from autocustomlyx.core import deploy
+
+__all__ = ["deploy"]
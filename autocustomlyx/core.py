@@ -0,0 +1,414 @@
+"""
+Shared core for the AutoCustomLyX installer scripts.
+
+The install / scrape logic lives here once; each entry-point script is a
+thin shim that calls deploy() with the strategy it wants.
+"""
+
+import hashlib
+import http.client
+import json
+import os
+import re
+import socket
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from shutil import copyfileobj, rmtree, which
+from urllib.request import urlopen
+from pathlib import Path
+
+IS_WINDOWS = sys.platform == "win32"
+IS_DARWIN = sys.platform == "darwin"
+
+HOME = Path.home()
+FLATPAK_ID = "org.lyx.LyX"
+FLATPAK_DATA_DIR = HOME / f".var/app/{FLATPAK_ID}"
+FLATPAK_CONFIG_DIR = FLATPAK_DATA_DIR / "config/lyx"
+
+# --- YOUR CUSTOM CONFIG ---
+RAW_HOST = "raw.githubusercontent.com"
+REPO_PATH = "/StupidityInc/lyx-config/main"
+CUSTOM_FILES = {
+    "preferences": "preferences",
+    "bind/user.bind": "bind/user.bind",
+    "Macros/Macros_Standard.lyx": "Macros/Macros_Standard.lyx",
+    "Templates/Assignments.lyx": "templates/Assignments.lyx"
+}
+
+# Where Hebrew (Culmus) fonts may live; checked once when granting flatpak access
+FONT_CANDIDATES = (
+    HOME / ".fonts",
+    HOME / ".local/share/fonts",
+    Path("/usr/share/fonts"),
+)
+
+### UTILITIES (Standard Script) ###
+
+@lru_cache(maxsize=None)
+def have(tool):
+    # which() walks every $PATH entry; cache the answer for the whole run
+    return which(tool) is not None
+
+def sudo():
+    return [] if IS_WINDOWS else ["sudo"]
+
+def run(command: list):
+    # argv list, no shell: one process per command and no quoting issues
+    if subprocess.run(command).returncode != 0:
+        print(f"[LyX Installer] Warning: Command failed: {' '.join(command)}")
+
+### TEXLIVE & LYX INSTALLATION (Standard Script) ###
+
+# Pre-seeded answers for install-tl: skips the option menus entirely and
+# drops doc/src files, which cuts the download by roughly half
+TEXLIVE_PROFILE = """\
+selected_scheme scheme-basic
+instopt_adjustpath 0
+tlpdbopt_autobackup 0
+tlpdbopt_install_docfiles 0
+tlpdbopt_install_srcfiles 0
+"""
+
+def strip_top_dir(members):
+    # Equivalent of tar --strip-components=1 (drop 'install-tl-YYYYMMDD/')
+    for m in members:
+        parts = m.name.split("/", 1)
+        if len(parts) == 2 and parts[1]:
+            m.name = parts[1]
+            yield m
+
+def download_texlive_installer() -> list:
+    installer_url = "https://mirror.ctan.org/systems/texlive/tlnet/install-tl.zip" if IS_WINDOWS else \
+                    "https://mirror.ctan.org/systems/texlive/tlnet/install-tl-unx.tar.gz"
+
+    if os.path.exists("install-tl"): rmtree("install-tl")
+
+    if IS_WINDOWS:
+        import zipfile
+        # zip needs random access, so stream to disk first, then extract in-process
+        archive_name = "install-tl.zip"
+        # A crashed earlier run may have left the archive behind — reuse it
+        if not (os.path.exists(archive_name) and os.path.getsize(archive_name) > 0):
+            with urlopen(installer_url) as res, open(archive_name, "wb") as f:
+                copyfileobj(res, f, length=1 << 20)
+        with zipfile.ZipFile(archive_name) as zf:
+            for info in zf.infolist():
+                parts = info.filename.split("/", 1)
+                if len(parts) < 2 or not parts[1]: continue
+                info.filename = parts[1]
+                zf.extract(info, "install-tl")
+        os.remove(archive_name)
+    else:
+        import tarfile
+        # Extract straight from the HTTP stream: no archive file, no tar fork
+        with urlopen(installer_url) as res, tarfile.open(fileobj=res, mode="r|gz") as tf:
+            tf.extractall("install-tl", members=strip_top_dir(tf))
+
+    return [".\\install-tl\\install-tl-windows.bat", "-no-gui"] if IS_WINDOWS else ["./install-tl/install-tl"]
+
+def cleanup_texlive():
+    if os.path.exists("install-tl"): rmtree("install-tl")
+    if os.path.exists("texlive.profile"): os.remove("texlive.profile")
+
+def get_texlive_dir():
+    return "C:\\texlive" if IS_WINDOWS else "/usr/local/texlive"
+
+@lru_cache(maxsize=1)
+def get_texlive_bin_dir():
+    # Helper to find the dynamic path (e.g., /2024/bin/x86_64-linux)
+    base = get_texlive_dir()
+    try:
+        # scandir caches is_dir() from the readdir pass — no extra stat per entry
+        with os.scandir(base) as it:
+            year = max((e.name for e in it if e.is_dir() and e.name.isdigit()),
+                       key=int, default=None)
+        if not year: return None
+        with os.scandir(os.path.join(base, year, "bin")) as it:
+            for e in it:
+                if e.is_dir(): return e.path
+        return None
+    except OSError: return None
+
+@lru_cache(maxsize=1)
+def lyx_flatpak_installed():
+    # 'flatpak info' is local-only; a no-op 'flatpak install' still hits Flathub
+    return subprocess.run(["flatpak", "info", "--user", FLATPAK_ID],
+                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode == 0
+
+def has_flathub_remote():
+    # Even with --if-not-exists, remote-add may re-fetch the .flatpakrepo file
+    result = subprocess.run(["flatpak", "remotes", "--user", "--columns=name"],
+                            capture_output=True, text=True)
+    return "flathub" in result.stdout.split()
+
+# Ordered (tool, install command) candidates per platform; first one on PATH
+# wins, so each tool is probed at most once (and cached by have())
+NATIVE_LYX_INSTALLERS = {
+    "win32": (("winget", ["winget", "install", "lyx.lyx"]),),
+    "darwin": (("brew", ["brew", "install", "lyx"]),),
+}
+
+def install_lyx():
+    # Your original logic (prioritizing Flatpak for Linux)
+    native = NATIVE_LYX_INSTALLERS.get(sys.platform)
+    if native is not None:
+        for tool, command in native:
+            if have(tool):
+                run(command)
+                return
+    else:
+        if have("flatpak"):
+            if not lyx_flatpak_installed():
+                if not has_flathub_remote():
+                    run(["flatpak", "remote-add", "--user", "--if-not-exists", "flathub",
+                         "https://flathub.org/repo/flathub.flatpakrepo"])
+                run(["flatpak", "install", "--user", "-y", "flathub", FLATPAK_ID])
+            # Grant host + font dirs in a single override (one fork, one DB rewrite)
+            filesystems = ["--filesystem=host"] + \
+                          [f"--filesystem={p}" for p in FONT_CANDIDATES if p.exists()]
+            run(["flatpak", "override", "--user", *filesystems, FLATPAK_ID])
+        elif have("apt-get"):
+            # Skip recommends: pulls in far fewer TeX packages we install ourselves
+            run(["sudo", "apt-get", "install", "-y", "--no-install-recommends", "lyx"])
+
+@lru_cache(maxsize=1)
+def get_lyx_user_dir():
+    # 1. Check Flatpak
+    if FLATPAK_CONFIG_DIR.exists(): return str(FLATPAK_CONFIG_DIR)
+    # 2. Native
+    if IS_WINDOWS:
+        roaming = os.environ.get("APPDATA")
+        if not roaming: return None
+        # scandir streams entries; %APPDATA% can hold hundreds of dirs
+        with os.scandir(roaming) as it:
+            latest = max((e.name for e in it if e.name.startswith("LyX")), default=None)
+        # Fallback if LyX was never run
+        return os.path.join(roaming, latest or "LyX2.4")
+    elif IS_DARWIN:
+        base = os.path.expanduser("~/Library/Application Support")
+        with os.scandir(base) as it:
+            latest = max((e.name for e in it if e.name.startswith("LyX")), default=None)
+        return os.path.join(base, latest or "LyX-2.4")
+    return os.path.expanduser("~/.lyx")
+
+def init_lyx():
+    # Runs LyX briefly to create folders
+    if have("flatpak") and FLATPAK_DATA_DIR.exists():
+        command = ["flatpak", "run", "--command=lyx", FLATPAK_ID, "-e", "info"]
+    elif have("lyx"):
+        command = ["lyx", "-e", "info"]
+    else:
+        return
+
+    try:
+        proc = subprocess.Popen(command)
+        # Stop as soon as the user dir shows up instead of riding out a
+        # fixed timeout — typically well under a second
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            if proc.poll() is not None:
+                return
+            # The dir is being created under us — drop the memoized miss
+            get_lyx_user_dir.cache_clear()
+            user_dir = get_lyx_user_dir()
+            if user_dir and os.path.exists(user_dir):
+                break
+            time.sleep(0.1)
+        proc.terminate()
+        try: proc.wait(timeout=2)
+        except subprocess.TimeoutExpired: proc.kill()
+    except OSError:
+        pass
+
+### THE NEW PART: SCRAPER ###
+
+# Any \path_prefix line already present in the downloaded preferences
+PATH_PREFIX_RE = re.compile(r'^\\path_prefix .*\n?', re.MULTILINE)
+
+# One keep-alive connection per thread, reused across all fetches
+_connections = threading.local()
+
+CACHE_DIR = HOME / ".cache/autocustomlyx"
+
+def load_etags():
+    try:
+        return json.loads((CACHE_DIR / "etags.json").read_text())
+    except (OSError, ValueError):
+        return {}
+
+def save_etags(etags):
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        (CACHE_DIR / "etags.json").write_text(json.dumps(etags))
+    except OSError:
+        pass
+
+def cached_body_path(remote):
+    return CACHE_DIR / hashlib.sha1(remote.encode()).hexdigest()
+
+def save_cached_body(remote, content):
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cached_body_path(remote).write_bytes(content)
+    except OSError:
+        pass
+
+def fetch_raw(path, headers=None):
+    # GET from raw.githubusercontent.com over a reusable keep-alive connection
+    all_headers = {"User-Agent": "AutoCustomLyX"}
+    if headers: all_headers.update(headers)
+
+    for attempt in (1, 2):
+        conn = getattr(_connections, "conn", None)
+        if conn is None:
+            conn = _connections.conn = http.client.HTTPSConnection(RAW_HOST, timeout=30)
+        try:
+            conn.request("GET", path, headers=all_headers)
+            return conn.getresponse()
+        except (http.client.HTTPException, OSError):
+            # Stale keep-alive socket: drop it and retry on a fresh one
+            conn.close()
+            _connections.conn = None
+            if attempt == 2: raise
+
+def fetch_config(remote, etag=None):
+    # Runs in a worker thread: network only, no file writes
+    print(f"Downloading {remote}...")
+    headers = {"If-None-Match": etag} if etag else None
+    response = fetch_raw(f"{REPO_PATH}/{remote}", headers)
+    body = response.read()
+    if response.status == 304:
+        return None, etag  # unchanged since last run
+    if response.status != 200:
+        raise RuntimeError(f"HTTP {response.status} for {remote}")
+    return body, response.getheader("ETag")
+
+def apply_custom_configs(tex_bin):
+    print("\n[LyX Installer] Applying StupidityInc Configurations...")
+    user_dir = get_lyx_user_dir()
+    if not user_dir: return
+
+    etags = load_etags()
+
+    # Create every destination folder up front (bind/, Macros/, ... repeat)
+    for folder in {os.path.dirname(os.path.join(user_dir, local))
+                   for local in CUSTOM_FILES.values()}:
+        os.makedirs(folder, exist_ok=True)
+
+    # Warm the resolver once so the worker threads don't each pay a DNS RTT
+    try: socket.gethostbyname(RAW_HOST)
+    except OSError: pass
+
+    # Fetch all files in parallel (network-bound), write them as they land
+    with ThreadPoolExecutor(max_workers=min(8, len(CUSTOM_FILES))) as pool:
+        futures = {}
+        for remote, local in CUSTOM_FILES.items():
+            dest = os.path.join(user_dir, local)
+            # Only send the cached ETag when we can still produce the content
+            # locally (file on disk, or its body kept in the cache dir)
+            restorable = os.path.exists(dest) or cached_body_path(remote).exists()
+            etag = etags.get(remote) if restorable else None
+            futures[pool.submit(fetch_config, remote, etag)] = (remote, local, dest)
+
+        for future in as_completed(futures):
+            remote, local, dest = futures[future]
+
+            try:
+                content, etag = future.result()
+                if content is None:
+                    if os.path.exists(dest):
+                        print(f"{local} unchanged, skipping.")
+                        continue
+                    # 304 but the file vanished locally: restore from the cache
+                    content = cached_body_path(remote).read_bytes()
+                else:
+                    save_cached_body(remote, content)
+
+                # MAGIC FIX: Inject the correct TeX path into preferences
+                # (only that file needs a decode; the rest are written verbatim)
+                # Write to a sibling temp file and rename: LyX never sees a
+                # half-written config if we die mid-write
+                tmp = Path(dest + ".part")
+                if "preferences" in local and tex_bin:
+                    # One regex pass drops any existing path_prefix lines,
+                    # then one concat appends the correct one
+                    text = PATH_PREFIX_RE.sub("", content.decode("utf-8"))
+                    sep = "" if (not text or text.endswith("\n")) else "\n"
+                    tmp.write_text(f'{text}{sep}\\path_prefix "{tex_bin}"',
+                                   encoding="utf-8")
+                else:
+                    tmp.write_bytes(content)
+                os.replace(tmp, dest)
+                if etag:
+                    etags[remote] = etag
+            except Exception as e:
+                print(f"❌ Error downloading {local}: {e}")
+
+    save_etags(etags)
+
+### MAIN ###
+
+def install_texlive():
+    # Standard Logic, returns the TeX bin dir (None if install failed)
+    tex_bin = get_texlive_bin_dir()
+    if not tex_bin:
+        # TeX from another channel (apt, MacTeX, ...) won't live under
+        # /usr/local/texlive — a PATH probe beats a ~300MB reinstall
+        existing = which("pdflatex") or which("tex")
+        if existing:
+            print("[LyX Installer] TeX already on PATH, skipping TeXLive install.")
+            return os.path.dirname(existing)
+
+        print("[LyX Installer] Installing TeXLive...")
+        inst = download_texlive_installer()
+        Path("texlive.profile").write_text(TEXLIVE_PROFILE)
+        run(sudo() + inst + ["--profile", "texlive.profile", "--no-interaction"])
+        cleanup_texlive()
+
+        # Install Packages (drop the memoized miss from before the install)
+        get_texlive_bin_dir.cache_clear()
+        tex_bin = get_texlive_bin_dir()
+        if tex_bin:
+            tlmgr = os.path.join(tex_bin, "tlmgr")
+            # One batched call; --persistent-downloads reuses the connection
+            # across the package fetches (not guaranteed on by default)
+            run(sudo() + [tlmgr, "--persistent-downloads", "install",
+                          "babel-hebrew", "hebrew-fonts", "culmus"])
+    return tex_bin
+
+def deploy(strategy="full"):
+    """Shared entry point for every installer script.
+
+    strategy="full"    Install TeXLive + LyX, then apply the custom configs.
+    strategy="configs" Only fetch the custom configs into the LyX user dir.
+    """
+    if strategy not in ("full", "configs"):
+        raise ValueError(f"unknown strategy: {strategy!r}")
+
+    if strategy == "full":
+        # Take the sudo prompt once up front so neither worker blocks on it
+        if not IS_WINDOWS and have("sudo"):
+            subprocess.run(["sudo", "-v"])
+
+        # 1+2. TeXLive and LyX don't depend on each other — overlap the two
+        # network-heavy installs instead of paying for them back to back
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            texlive_future = pool.submit(install_texlive)
+            lyx_future = pool.submit(install_lyx)
+            tex_bin = texlive_future.result()
+            lyx_future.result()
+
+        init_lyx()
+    else:
+        # Configs-only: use whatever TeX is already there for path_prefix
+        tex_bin = get_texlive_bin_dir()
+
+    # 3. APPLY CUSTOM CONFIGS (The "Add at the end" part)
+    # This overwrites the default files with your GitHub files
+    apply_custom_configs(tex_bin)
+
+    print("\n[LyX Installer] Done! Restart LyX and run Tools > Reconfigure.")
\ No newline at end of file